@@ -19,12 +19,13 @@ DESIGN CONSTRAINTS (DO NOT VIOLATE):
 """
 
 import base64
+import http.client
 import json
 import os
 import subprocess
 import sys
 import time
-import urllib.error
+import urllib.parse
 import urllib.request
 
 # ---------------------------------------------------------------------------
@@ -186,6 +187,83 @@ def _candidate_urls() -> list:
     return result
 
 
+# One keep-alive connection per orchestrator base URL. The dispatch loop POSTs
+# to the same orchestrator for every generate/dispatch_result round trip, so
+# reusing the socket avoids a TCP (and TLS) handshake per message.
+_connections = {}
+
+
+class _HTTPStatusError(Exception):
+    """Orchestrator was reachable but answered with an HTTP error status."""
+
+    def __init__(self, status: int, reason: str, body: str):
+        super().__init__(f"HTTP {status} {reason}")
+        self.status = status
+        self.reason = reason
+        self.body = body
+
+
+def _get_connection(base_url: str) -> http.client.HTTPConnection:
+    """Return the cached connection for base_url, creating it if needed."""
+    conn = _connections.get(base_url)
+    if conn is None:
+        parts = urllib.parse.urlsplit(base_url)
+        conn_cls = (
+            http.client.HTTPSConnection
+            if parts.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        conn = conn_cls(parts.hostname, parts.port)
+        _connections[base_url] = conn
+    return conn
+
+
+def _drop_connection(base_url: str):
+    conn = _connections.pop(base_url, None)
+    if conn is not None:
+        conn.close()
+
+
+def _post_once(base_url: str, data: bytes, timeout: int) -> str:
+    """POST data to base_url's dispatch gateway and return the response body.
+
+    Raises _HTTPStatusError for HTTP error statuses; connection-level failures
+    propagate as OSError / http.client.HTTPException.
+    """
+    path = urllib.parse.urlsplit(base_url).path.rstrip("/") + "/v1/dispatch-gateway"
+    headers = {"Content-Type": "application/json"}
+    for attempt in range(2):
+        conn = _get_connection(base_url)
+        reused = conn.sock is not None
+        # Applies to the next connect() as well as to an already-open socket.
+        conn.timeout = timeout or None
+        if reused:
+            conn.sock.settimeout(conn.timeout)
+        try:
+            conn.request("POST", path, body=data, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read().decode("utf-8")
+        except (
+            http.client.RemoteDisconnected,
+            ConnectionResetError,
+            BrokenPipeError,
+        ):
+            _drop_connection(base_url)
+            # The server may close an idle keep-alive socket between round
+            # trips; retry once on a fresh connection before giving up.
+            if reused and attempt == 0:
+                debug_print(f"Stale connection to {base_url}, reconnecting")
+                continue
+            raise
+        except Exception:
+            _drop_connection(base_url)
+            raise
+        debug_print(f"← {resp.status} ({len(body)} bytes)")
+        if resp.status >= 400:
+            raise _HTTPStatusError(resp.status, resp.reason, body)
+        return body
+
+
 def post_json(payload: dict, timeout: int = 0) -> dict:
     """POST JSON to /v1/dispatch-gateway, trying all candidate URLs in order.
 
@@ -193,30 +271,22 @@ def post_json(payload: dict, timeout: int = 0) -> dict:
     long-running dispatch results — see ADR-040 §bootstrap.py Dispatch Loop).
     Exits the process with status 1 if all candidates fail.
     """
-    data = json.dumps(payload).encode("utf-8")
+    data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
     errors = []
     for base_url in _candidate_urls():
         url = f"{base_url}/v1/dispatch-gateway"
         debug_print(f"POST → {url} ({len(data)} bytes, type={payload.get('type')})")
-        req = urllib.request.Request(
-            url,
-            data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
         try:
-            with urllib.request.urlopen(req, timeout=timeout or None) as resp:
-                body = resp.read().decode("utf-8")
-                debug_print(f"← {resp.status} ({len(body)} bytes)")
-                return json.loads(body)
-        except urllib.error.HTTPError as e:
+            return json.loads(_post_once(base_url, data, timeout))
+        except _HTTPStatusError as e:
             # Server IS reachable but returned an error — do NOT fall through
             # to the next candidate URL.  Only connection-level failures
-            # (URLError / OSError) should trigger URL fallback.
-            body = e.read().decode("utf-8")
-            debug_print(f"HTTP error: {base_url}: HTTP {e.code} {e.reason} — {body}")
+            # (OSError / HTTPException) should trigger URL fallback.
+            debug_print(
+                f"HTTP error: {base_url}: HTTP {e.status} {e.reason} — {e.body}"
+            )
             print(
-                f"Error: Orchestrator returned HTTP {e.code}: {body}",
+                f"Error: Orchestrator returned HTTP {e.status}: {e.body}",
                 file=sys.stderr,
             )
             sys.exit(1)
@@ -344,27 +414,32 @@ def _clean_str(s):
 
 def build_history_context(history_json: str) -> str:
     """Return a formatted history prefix from the AEGIS_ITERATION_HISTORY env var."""
+    # First iterations (the common case) carry no history; skip the parse.
+    if history_json in ("", "[]"):
+        return ""
     try:
         history = json.loads(history_json)
     except json.JSONDecodeError:
         return ""
     if not history:
         return ""
-    ctx = "\n\n# Previous Attempts:\n"
+    parts = ["\n\n# Previous Attempts:\n"]
     for item in history:
-        ctx += f"\n## Iteration {item.get('iteration', '?')}:\n"
+        parts.append(f"\n## Iteration {item.get('iteration', '?')}:\n")
         if item.get("output"):
-            ctx += f"Output:\n{_clean_str(item['output'])}\n"
+            parts.append(f"Output:\n{_clean_str(item['output'])}\n")
         if item.get("error"):
-            ctx += f"Error:\n{_clean_str(item['error'])}\n"
+            parts.append(f"Error:\n{_clean_str(item['error'])}\n")
         # Prefer rich GradientResult feedback; fall back to validation_reason when
         # the validation pipeline itself errored rather than returning a score.
         if item.get("feedback"):
-            ctx += f"Feedback:\n{_clean_str(item['feedback'])}\n"
+            parts.append(f"Feedback:\n{_clean_str(item['feedback'])}\n")
         elif item.get("validation_reason"):
-            ctx += f"Validation Failed:\n{_clean_str(item['validation_reason'])}\n"
-    ctx += "\n# Current Attempt:\n"
-    return ctx
+            parts.append(
+                f"Validation Failed:\n{_clean_str(item['validation_reason'])}\n"
+            )
+    parts.append("\n# Current Attempt:\n")
+    return "".join(parts)
 
 
 # ---------------------------------------------------------------------------
@@ -1,40 +1,61 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
 
 ROOT = Path(__file__).resolve().parent
 HEADER = (
     "// Copyright (c) 2026 100monkeys.ai\n"
     "// SPDX-License-Identifier: AGPL-3.0\n\n"
 )
-SPDX_MARKER = "SPDX-License-Identifier: AGPL-3.0"
+SPDX_MARKER = b"SPDX-License-Identifier: AGPL-3.0"
+# Headers sit at the top of the file; this prefix is all we need to inspect.
+HEAD_BYTES = 512
 SKIP_DIRS = {"target", ".git", ".github", ".idea", ".vscode"}
 
 
-def should_skip(path: Path) -> bool:
-    return any(part in SKIP_DIRS for part in path.parts)
+def walk_rs(root: str) -> Iterator[str]:
+    """Yield every .rs file under root, pruning SKIP_DIRS before descending."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.name in SKIP_DIRS:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".rs"):
+                    yield entry.path
 
 
-def add_header(file_path: Path) -> bool:
-    content = file_path.read_text(encoding="utf-8")
-    if SPDX_MARKER in content:
-        return False
+def add_header(file_path: str) -> bool:
+    with open(file_path, "rb") as f:
+        head = f.read(HEAD_BYTES)
+        if SPDX_MARKER in head:
+            return False
+        rest = f.read()
 
-    file_path.write_text(HEADER + content, encoding="utf-8")
+    header = HEADER.encode("utf-8")
+    if b"\r\n" in head:
+        # Match CRLF sources so the header doesn't leave mixed line endings.
+        header = header.replace(b"\n", b"\r\n")
+    with open(file_path, "wb") as f:
+        f.write(header + head + rest)
     return True
 
 
 def main() -> int:
-    updated = 0
-    scanned = 0
-
-    for file_path in ROOT.rglob("*.rs"):
-        if should_skip(file_path):
-            continue
-        scanned += 1
-        if add_header(file_path):
-            updated += 1
+    paths = list(walk_rs(str(ROOT)))
+
+    # Work is dominated by read/write syscalls, so threads overlap it well.
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+        results = list(ex.map(add_header, paths))
+
+    scanned = len(paths)
+    updated = sum(results)
 
     print(f"Scanned {scanned} Rust files. Updated {updated} files.")
     return 0